@@ -8,6 +8,9 @@ fn main() {
     let dest_path = Path::new(&out_dir).join("constants.gen.rs");
     let mut f = File::create(&dest_path).unwrap();
 
+    // cargo has already parsed Cargo.toml for us; no need to read the
+    // manifest again to find the version.
+    let version = env::var("CARGO_PKG_VERSION").unwrap();
     let target = env::var("TARGET").unwrap();
     let mut target_bits = target.split('-');
 
@@ -25,6 +28,11 @@ fn main() {
     writeln!(f, "/// The CPU architecture identifier").ok();
     writeln!(f, "pub const ARCH: &str = \"{}\";", arch).ok();
     writeln!(f, "/// The user agent for sentry events").ok();
-    writeln!(f, "pub const USER_AGENT: &str = \"sentry-cli/{}\";", arch).ok();
+    writeln!(
+        f,
+        "pub const USER_AGENT: &str = \"sentry-cli/{}\";",
+        version
+    )
+    .ok();
     println!("cargo:rerun-if-changed=build.rs\n");
 }
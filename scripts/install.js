@@ -172,7 +172,7 @@ function downloadBinary() {
       } else {
         decompressor = new stream.PassThrough();
       }
-      const name = downloadUrl.match(/.*\/(.*?)$/)[1];
+      const name = downloadUrl.slice(downloadUrl.lastIndexOf('/') + 1);
       const total = parseInt(response.headers.get('content-length'), 10);
       const progressBar = createProgressBar(name, total);
       const tempPath = getTempFile(cachedPath);
@@ -8,7 +8,6 @@ use std::cell::RefCell;
 use std::collections::{HashMap, HashSet};
 use std::ffi::OsStr;
 use std::fmt;
-use std::fs::File;
 use std::io::{self, Read, Write};
 use std::path::{Path, PathBuf};
 use std::rc::Rc;
@@ -450,7 +449,7 @@ impl Api {
     }
 
     /// Convenience method that downloads a file into the given file object.
-    pub fn download(&self, url: &str, dst: &mut File) -> ApiResult<ApiResponse> {
+    pub fn download<W: Write>(&self, url: &str, dst: &mut W) -> ApiResult<ApiResponse> {
         self.request(Method::Get, &url)?
             .follow_location(true)?
             .send_into(dst)
@@ -458,7 +457,11 @@ impl Api {
 
     /// Convenience method that downloads a file into the given file object
     /// and show a progress bar
-    pub fn download_with_progress(&self, url: &str, dst: &mut File) -> ApiResult<ApiResponse> {
+    pub fn download_with_progress<W: Write>(
+        &self,
+        url: &str,
+        dst: &mut W,
+    ) -> ApiResult<ApiResponse> {
         self.request(Method::Get, &url)?
             .follow_location(true)?
             .progress_bar_mode(ProgressBarMode::Response)?
@@ -952,15 +955,12 @@ impl Api {
         info!("Looking for file named: {}", ref_name);
 
         if resp.status() == 200 {
-            let info: RegistryRelease = resp.convert()?;
-            for (filename, download_url) in info.file_urls {
-                info!("Found asset {}", filename);
-                if filename == ref_name {
-                    return Ok(Some(SentryCliRelease {
-                        version: info.version,
-                        download_url,
-                    }));
-                }
+            let mut info: RegistryRelease = resp.convert()?;
+            if let Some(download_url) = info.file_urls.remove(&ref_name) {
+                return Ok(Some(SentryCliRelease {
+                    version: info.version,
+                    download_url,
+                }));
             }
             warn!("Unable to find release file");
             Ok(None)
@@ -21,6 +21,7 @@ use crate::utils::releases::detect_release_name;
 const BASH_SCRIPT: &str = include_str!("../bashsupport.sh");
 lazy_static! {
     static ref FRAME_RE: Regex = Regex::new(r#"^(.*?):(.*):(\d+)$"#).unwrap();
+    static ref PLACEHOLDER_RE: Regex = Regex::new(r"___SENTRY_[A-Z_]+___").unwrap();
 }
 
 pub fn make_app<'a, 'b: 'a>(app: App<'a, 'b>) -> App<'a, 'b> {
@@ -132,18 +133,16 @@ fn send_event(traceback: &str, logfile: &str, environ: bool) -> Result<(), Error
 
             let filename = frame.filename.as_deref().expect("frame without location");
 
-            if !source_caches.contains_key(filename) {
+            let source = source_caches.entry(filename).or_insert_with(|| {
                 if let Ok(f) = fs::File::open(filename) {
-                    let lines: Vec<_> = BufReader::new(f)
+                    BufReader::new(f)
                         .lines()
                         .map(|x| x.unwrap_or_else(|_| "".to_string()))
-                        .collect();
-                    source_caches.insert(filename, lines);
+                        .collect()
                 } else {
-                    source_caches.insert(filename, vec![]);
+                    vec![]
                 }
-            }
-            let source = &source_caches[filename];
+            });
             frame.context_line = source.get(lineno.saturating_sub(1)).cloned();
             if let Some(slice) = source.get(lineno.saturating_sub(5)..lineno.saturating_sub(1)) {
                 frame.pre_context = slice.to_vec();
@@ -190,27 +189,27 @@ pub fn execute(matches: &ArgMatches<'_>) -> Result<(), Error> {
         ".sentry-{}.traceback",
         Uuid::new_v4().to_hyphenated_ref().to_string()
     ));
-    let mut script = BASH_SCRIPT
-        .replace(
-            "___SENTRY_TRACEBACK_FILE___",
-            &traceback.display().to_string(),
-        )
-        .replace("___SENTRY_LOG_FILE___", &log.display().to_string());
-
-    if matches.is_present("cli") {
-        script = script.replace("___SENTRY_CLI___", matches.value_of("cli").unwrap());
-    } else {
-        script = script.replace(
-            "___SENTRY_CLI___",
-            &env::current_exe().unwrap().display().to_string(),
-        );
-    }
+    let cli = match matches.value_of("cli") {
+        Some(cli) => cli.to_string(),
+        None => env::current_exe().unwrap().display().to_string(),
+    };
 
-    if matches.is_present("no_environ") {
-        script = script.replace("___SENTRY_NO_ENVIRON___", "--no-environ");
-    } else {
-        script = script.replace("___SENTRY_NO_ENVIRON___", "");
-    }
+    // substitute all placeholders in a single pass instead of rewriting
+    // the entire script once per placeholder.
+    let mut script = PLACEHOLDER_RE
+        .replace_all(BASH_SCRIPT, |caps: &regex::Captures<'_>| match &caps[0] {
+            "___SENTRY_TRACEBACK_FILE___" => traceback.display().to_string(),
+            "___SENTRY_LOG_FILE___" => log.display().to_string(),
+            "___SENTRY_CLI___" => cli.clone(),
+            "___SENTRY_NO_ENVIRON___" => if matches.is_present("no_environ") {
+                "--no-environ"
+            } else {
+                ""
+            }
+            .to_string(),
+            other => other.to_string(),
+        })
+        .into_owned();
 
     if !matches.is_present("no_exit") {
         script.insert_str(0, "set -e\n\n");
@@ -73,7 +73,7 @@ pub fn execute(matches: &ArgMatches<'_>) -> Result<(), Error> {
 
 fn execute_list<'a>(ctx: &MonitorContext, _matches: &ArgMatches<'a>) -> Result<(), Error> {
     let mut monitors = ctx.api.list_organization_monitors(ctx.get_org()?)?;
-    monitors.sort_by_key(|p| (p.name.clone()));
+    monitors.sort_by_cached_key(|p| p.name.clone());
 
     let mut table = Table::new();
     table.title_row().add("ID").add("Name").add("Status");
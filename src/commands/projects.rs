@@ -19,7 +19,7 @@ pub fn execute(matches: &ArgMatches<'_>) -> Result<(), Error> {
     let api = Api::current();
     let org = config.get_org(matches)?;
     let mut projects = api.list_organization_projects(&org)?;
-    projects.sort_by_key(|p| {
+    projects.sort_by_cached_key(|p| {
         (
             p.team.as_ref().map_or(String::new(), |t| t.name.clone()),
             p.name.clone(),
@@ -1,6 +1,8 @@
 //! Implements a command for managing releases.
 use std::collections::HashSet;
 use std::ffi::OsStr;
+use std::io;
+use std::io::Write;
 use std::path::{Path, PathBuf};
 use std::sync::Arc;
 
@@ -681,13 +683,16 @@ fn execute_list<'a>(ctx: &ReleaseContext<'_>, matches: &ArgMatches<'a>) -> Resul
     let releases = ctx.api.list_releases(ctx.get_org()?, project.as_deref())?;
 
     if matches.is_present("raw") {
-        let versions = releases
-            .iter()
-            .map(|release_info| release_info.version.clone())
-            .collect::<Vec<_>>()
-            .join(matches.value_of("delimiter").unwrap_or("\n"));
-
-        println!("{}", versions);
+        let delimiter = matches.value_of("delimiter").unwrap_or("\n");
+        let stdout = io::stdout();
+        let mut out = stdout.lock();
+        for (idx, release_info) in releases.iter().enumerate() {
+            if idx > 0 {
+                out.write_all(delimiter.as_bytes())?;
+            }
+            out.write_all(release_info.version.as_bytes())?;
+        }
+        out.write_all(b"\n")?;
         return Ok(());
     }
 
@@ -31,18 +31,16 @@ pub fn validate_project(v: String) -> Result<(), String> {
     }
 }
 
+/// Characters that must not show up in release versions.
+const INVALID_VERSION_CHARS: &[char] = &['\n', '\t', '\x0b', '\x0c', '/'];
+
 fn validate_version(v: String) -> Result<(), String> {
     if v.trim() != v {
         Err(
             "Invalid release version. Releases must not contain leading or trailing spaces."
                 .to_string(),
         )
-    } else if v.is_empty()
-        || v == "."
-        || v == ".."
-        || v.find(&['\n', '\t', '\x0b', '\x0c', '\t', '/'][..])
-            .is_some()
-    {
+    } else if v.is_empty() || v == "." || v == ".." || v.find(INVALID_VERSION_CHARS).is_some() {
         Err(
             "Invalid release version. Slashes and certain whitespace characters are not permitted."
                 .to_string(),
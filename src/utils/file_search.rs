@@ -87,7 +87,9 @@ impl ReleaseFileSearch {
 
     pub fn collect_file(path: PathBuf) -> Result<ReleaseFileMatch, Error> {
         let mut f = fs::File::open(path.clone())?;
-        let mut contents = Vec::new();
+        // pre-size the buffer so read_to_end does not have to grow it.
+        let mut contents =
+            Vec::with_capacity(f.metadata().map(|md| md.len() as usize).unwrap_or(0));
         f.read_to_end(&mut contents)?;
         Ok(ReleaseFileMatch {
             base_path: path.clone(),
@@ -148,7 +150,8 @@ impl ReleaseFileSearch {
             );
 
             let mut f = fs::File::open(file.path())?;
-            let mut contents = Vec::new();
+            let mut contents =
+                Vec::with_capacity(f.metadata().map(|md| md.len() as usize).unwrap_or(0));
             f.read_to_end(&mut contents)?;
 
             let file_match = ReleaseFileMatch {
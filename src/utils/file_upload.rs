@@ -127,11 +127,14 @@ fn upload_files_parallel(
     let api = Api::current();
 
     // get a list of release files first so we know the file IDs of
-    // files that already exist.
+    // files that already exist.  Filtering by dist up front means the
+    // per-file lookup below can use the URL directly without building
+    // a (dist, name) key for every upload.
     let release_files: HashMap<_, _> = api
         .list_release_files(context.org, context.project, context.release)?
         .into_iter()
-        .map(|artifact| ((artifact.dist, artifact.name), artifact.id))
+        .filter(|artifact| artifact.dist.as_deref() == context.dist)
+        .map(|artifact| (artifact.name, artifact.id))
         .collect();
 
     println!(
@@ -170,9 +173,7 @@ fn upload_files_parallel(
                     bytes.clone(),
                 ));
 
-                if let Some(old_id) =
-                    release_files.get(&(context.dist.map(|x| x.into()), file.url.clone()))
-                {
+                if let Some(old_id) = release_files.get(&file.url) {
                     api.delete_release_file(
                         context.org,
                         context.project,
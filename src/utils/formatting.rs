@@ -44,11 +44,7 @@ impl TableRow {
     }
 
     fn make_row(&self) -> prettytable::Row {
-        let mut row = prettytable::Row::empty();
-        for cell in &self.cells {
-            row.add_cell(cell.clone());
-        }
-        row
+        prettytable::Row::new(self.cells.clone())
     }
 }
 
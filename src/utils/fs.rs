@@ -60,7 +60,7 @@ impl TempFile {
         let mut destination = env::temp_dir();
         destination.push(Uuid::new_v4().to_hyphenated_ref().to_string());
 
-        fs::rename(&path, &destination)?;
+        move_file(&path, &destination)?;
         Ok(TempFile { path: destination })
     }
 
@@ -93,6 +93,19 @@ impl Drop for TempFile {
     }
 }
 
+/// Moves a file to a new location.
+///
+/// This is a thin wrapper around `fs::rename` that falls back to copying
+/// and deleting the source when the rename fails, which notably happens
+/// when source and destination live on different file systems.
+pub fn move_file<P: AsRef<Path>, Q: AsRef<Path>>(src: P, dst: Q) -> io::Result<()> {
+    if fs::rename(&src, &dst).is_err() {
+        fs::copy(&src, &dst)?;
+        fs::remove_file(&src)?;
+    }
+    Ok(())
+}
+
 /// Checks if a path is writable.
 pub fn is_writable<P: AsRef<Path>>(path: P) -> bool {
     fs::OpenOptions::new()
@@ -51,23 +51,25 @@ impl log::Log for Logger {
         }
 
         let level = self.get_actual_level(record.metadata());
-        let (level_name, level_color) = match level {
-            log::Level::Error => ("ERROR", Color::Red),
-            log::Level::Warn => ("WARN ", Color::Red),
-            log::Level::Info => ("INFO ", Color::Cyan),
-            log::Level::Debug => ("DEBUG", Color::Yellow),
-            log::Level::Trace => ("TRACE", Color::Magenta),
+        // the labels are pre-padded so no per-record format call is
+        // needed to build them.
+        let (level_label, level_color) = match level {
+            log::Level::Error => ("  ERROR  ", Color::Red),
+            log::Level::Warn => ("  WARN   ", Color::Red),
+            log::Level::Info => ("  INFO   ", Color::Cyan),
+            log::Level::Debug => ("  DEBUG  ", Color::Yellow),
+            log::Level::Trace => ("  TRACE  ", Color::Magenta),
         };
         let short_target = record.target().split("::").next().unwrap_or("");
         let msg = format!(
             "{} {} {}{}",
-            style(format!("  {}  ", level_name)).bg(level_color).black(),
+            style(level_label).bg(level_color).black(),
             style(Local::now()).dim(),
             style(record.args()),
             style(if short_target != "sentry_cli" {
                 format!("  (from {})", short_target)
             } else {
-                "".to_string()
+                String::new()
             })
             .dim(),
         );
@@ -1,7 +1,7 @@
 use std::env;
 use std::ffi::OsStr;
 use std::fs;
-use std::io::Read;
+use std::io::{BufRead, BufReader};
 use std::path::{Path, PathBuf};
 
 use failure::{bail, Error};
@@ -59,7 +59,6 @@ pub fn infer_gradle_release_name(path: Option<PathBuf>) -> Result<Option<String>
             Regex::new(r#"versionName\s+["']([^"']*)["']"#).unwrap();
     }
 
-    let mut contents = String::new();
     let mut here = path.unwrap_or(env::current_dir()?);
     loop {
         if_chain! {
@@ -67,12 +66,35 @@ pub fn infer_gradle_release_name(path: Option<PathBuf>) -> Result<Option<String>
             if build_md.is_file();
             if let Ok(app_md) = here.join("app/build.gradle").metadata();
             if app_md.is_file();
-            if let Ok(mut f) = fs::File::open(here.join("app/build.gradle"));
-            if f.read_to_string(&mut contents).is_ok();
-            if let Some(app_id_caps) = APP_ID_RE.captures(&contents);
-            if let Some(version_caps) = VERSION_NAME_RE.captures(&contents);
+            if let Ok(f) = fs::File::open(here.join("app/build.gradle"));
             then {
-                return Ok(Some(format!("{}@{}", &app_id_caps[1], &version_caps[1])));
+                // scan the file line by line instead of reading it into
+                // memory as a whole and stop as soon as both values are
+                // found.
+                let mut app_id = None;
+                let mut version_name = None;
+                for line in BufReader::new(f).lines() {
+                    let line = match line {
+                        Ok(line) => line,
+                        Err(_) => break,
+                    };
+                    if app_id.is_none() {
+                        if let Some(caps) = APP_ID_RE.captures(&line) {
+                            app_id = Some(caps[1].to_string());
+                        }
+                    }
+                    if version_name.is_none() {
+                        if let Some(caps) = VERSION_NAME_RE.captures(&line) {
+                            version_name = Some(caps[1].to_string());
+                        }
+                    }
+                    if app_id.is_some() && version_name.is_some() {
+                        break;
+                    }
+                }
+                if let (Some(app_id), Some(version_name)) = (app_id, version_name) {
+                    return Ok(Some(format!("{}@{}", app_id, version_name)));
+                }
             }
         }
         if !here.pop() {
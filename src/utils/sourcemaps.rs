@@ -9,6 +9,7 @@ use console::style;
 use failure::{bail, Error};
 use if_chain::if_chain;
 use log::{debug, info, warn};
+use rayon::prelude::*;
 use symbolic::debuginfo::sourcebundle::SourceFileType;
 use url::Url;
 
@@ -107,12 +108,12 @@ pub fn get_sourcemap_reference_from_headers<'a, I: Iterator<Item = (&'a String,
     None
 }
 
-fn guess_sourcemap_reference(sourcemaps: &HashSet<String>, min_url: &str) -> Result<String, Error> {
+fn guess_sourcemap_reference(sourcemaps: &HashSet<String>, min_url: &str) -> Option<String> {
     // if there is only one sourcemap in total we just assume that's the one.
     // We just need to make sure that we fix up the reference if we need to
     // (eg: ~/ -> /).
     if sourcemaps.len() == 1 {
-        return Ok(sourcemap::make_relative_path(
+        return Some(sourcemap::make_relative_path(
             min_url,
             sourcemaps.iter().next().unwrap(),
         ));
@@ -123,21 +124,21 @@ fn guess_sourcemap_reference(sourcemaps: &HashSet<String>, min_url: &str) -> Res
 
     // foo.min.js -> foo.map
     if sourcemaps.contains(&unsplit_url(path, basename, Some("map"))) {
-        return Ok(unsplit_url(None, basename, Some("map")));
+        return Some(unsplit_url(None, basename, Some("map")));
     }
 
     if let Some(ext) = ext.as_ref() {
         // foo.min.js -> foo.min.js.map
         let new_ext = format!("{}.{}", ext, map_ext);
         if sourcemaps.contains(&unsplit_url(path, basename, Some(&new_ext))) {
-            return Ok(unsplit_url(None, basename, Some(&new_ext)));
+            return Some(unsplit_url(None, basename, Some(&new_ext)));
         }
 
         // foo.min.js -> foo.js.map
         if let Some(rest) = ext.strip_prefix("min.") {
             let new_ext = format!("{}.{}", rest, map_ext);
             if sourcemaps.contains(&unsplit_url(path, basename, Some(&new_ext))) {
-                return Ok(unsplit_url(None, basename, Some(&new_ext)));
+                return Some(unsplit_url(None, basename, Some(&new_ext)));
             }
         }
 
@@ -148,22 +149,53 @@ fn guess_sourcemap_reference(sourcemaps: &HashSet<String>, min_url: &str) -> Res
             parts[parts_len - 1] = &map_ext;
             let new_ext = parts.join(".");
             if sourcemaps.contains(&unsplit_url(path, basename, Some(&new_ext))) {
-                return Ok(unsplit_url(None, basename, Some(&new_ext)));
+                return Some(unsplit_url(None, basename, Some(&new_ext)));
             }
         }
     }
 
-    bail!(
-        "Could not auto-detect referenced sourcemap for {}.",
-        min_url
-    );
+    None
 }
 
 pub struct SourceMapProcessor {
-    pending_sources: HashSet<(String, ReleaseFileMatch)>,
+    pending_sources: HashMap<String, ReleaseFileMatch>,
     sources: ReleaseFiles,
 }
 
+fn classify_file(file: &mut ReleaseFileMatch) -> SourceFileType {
+    if sourcemap::is_sourcemap_slice(&file.contents) {
+        SourceFileType::SourceMap
+    } else if file
+        .path
+        .file_name()
+        .and_then(OsStr::to_str)
+        .map(|x| x.ends_with("bundle"))
+        .unwrap_or(false)
+        && sourcemap::ram_bundle::is_ram_bundle_slice(&file.contents)
+    {
+        SourceFileType::IndexedRamBundle
+    } else if file
+        .path
+        .file_name()
+        .and_then(OsStr::to_str)
+        .map(|x| x.contains(".min."))
+        .unwrap_or(false)
+        || is_likely_minified_js(&file.contents)
+    {
+        SourceFileType::MinifiedSource
+    } else if is_hermes_bytecode(&file.contents) {
+        // This is actually a big hack:
+        // For the react-native Hermes case, we skip uploading the bytecode bundle,
+        // and rather flag it as an empty "minified source". That way, it
+        // will get a SourceMap reference, and the server side processor
+        // should deal with it accordingly.
+        file.contents.clear();
+        SourceFileType::MinifiedSource
+    } else {
+        SourceFileType::Source
+    }
+}
+
 fn is_hermes_bytecode(slice: &[u8]) -> bool {
     // The hermes bytecode format magic is defined here:
     // https://github.com/facebook/hermes/blob/5243222ef1d92b7393d00599fc5cff01d189a88a/include/hermes/BCGen/HBC/BytecodeFileFormat.h#L24-L25
@@ -175,14 +207,14 @@ impl SourceMapProcessor {
     /// Creates a new sourcemap validator.
     pub fn new() -> SourceMapProcessor {
         SourceMapProcessor {
-            pending_sources: HashSet::new(),
+            pending_sources: HashMap::new(),
             sources: HashMap::new(),
         }
     }
 
     /// Adds a new file for processing.
     pub fn add(&mut self, url: &str, file: ReleaseFileMatch) -> Result<(), Error> {
-        self.pending_sources.insert((url.to_string(), file));
+        self.pending_sources.insert(url.to_string(), file);
         Ok(())
     }
 
@@ -198,60 +230,38 @@ impl SourceMapProcessor {
             style(">").dim(),
             style(self.pending_sources.len()).yellow()
         );
-        for (url, mut file) in self.pending_sources.drain() {
-            pb.set_message(url.to_owned());
-            let ty = if sourcemap::is_sourcemap_slice(&file.contents) {
-                SourceFileType::SourceMap
-            } else if file
-                .path
-                .file_name()
-                .and_then(OsStr::to_str)
-                .map(|x| x.ends_with("bundle"))
-                .unwrap_or(false)
-                && sourcemap::ram_bundle::is_ram_bundle_slice(&file.contents)
-            {
-                SourceFileType::IndexedRamBundle
-            } else if file
-                .path
-                .file_name()
-                .and_then(OsStr::to_str)
-                .map(|x| x.contains(".min."))
-                .unwrap_or(false)
-                || is_likely_minified_js(&file.contents)
-            {
-                SourceFileType::MinifiedSource
-            } else if is_hermes_bytecode(&file.contents) {
-                // This is actually a big hack:
-                // For the react-native Hermes case, we skip uploading the bytecode bundle,
-                // and rather flag it as an empty "minified source". That way, it
-                // will get a SourceMap reference, and the server side processor
-                // should deal with it accordingly.
-                file.contents.clear();
-                SourceFileType::MinifiedSource
-            } else {
-                SourceFileType::Source
-            };
+        // classifying a source can be expensive — most notably the
+        // minified-JS heuristic has to look at the entire file — so the
+        // analysis runs in parallel.
+        let pending: Vec<_> = self.pending_sources.drain().collect();
+        let analyzed: Vec<_> = pending
+            .into_par_iter()
+            .map(|(url, mut file)| {
+                pb.set_message(url.to_owned());
+                let ty = classify_file(&mut file);
+                pb.inc(1);
+                (
+                    url.clone(),
+                    ReleaseFile {
+                        url,
+                        path: file.path,
+                        contents: file.contents,
+                        ty,
+                        headers: vec![],
+                        messages: vec![],
+                    },
+                )
+            })
+            .collect();
 
-            self.sources.insert(
-                url.clone(),
-                ReleaseFile {
-                    url: url.clone(),
-                    path: file.path,
-                    contents: file.contents,
-                    ty,
-                    headers: vec![],
-                    messages: vec![],
-                },
-            );
-            pb.inc(1);
-        }
+        self.sources.extend(analyzed);
 
         pb.finish_with_duration("Analyzing");
     }
 
     pub fn dump_log(&self, title: &str) {
         let mut sources: Vec<_> = self.sources.values().collect();
-        sources.sort_by_key(|&source| (source.ty, source.url.clone()));
+        sources.sort_by_cached_key(|&source| (source.ty, source.url.clone()));
 
         println!();
         println!("{}", style(title).dim().bold());
@@ -352,11 +362,11 @@ impl SourceMapProcessor {
 
         let sourcemap_url =
             match guess_sourcemap_reference(&sourcemaps_references, bundle_source_url) {
-                Ok(filename) => {
+                Some(filename) => {
                     let (path, _, _) = split_url(bundle_source_url);
                     unsplit_url(path, &filename, None)
                 }
-                Err(_) => {
+                None => {
                     warn!("Sourcemap reference for {} not found!", bundle_source_url);
                     return Ok(());
                 }
@@ -510,14 +520,11 @@ impl SourceMapProcessor {
             // we silently ignore when we can't find a sourcemap. Maybe we should
             // log this.
             match guess_sourcemap_reference(&sourcemaps, &source.url) {
-                Ok(target_url) => {
+                Some(target_url) => {
                     source.headers.push(("Sourcemap".to_string(), target_url));
                 }
-                Err(err) => {
-                    source.warn(format!(
-                        "could not determine a source map reference ({})",
-                        err
-                    ));
+                None => {
+                    source.warn("could not determine a source map reference".to_string());
                 }
             }
         }
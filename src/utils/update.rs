@@ -1,7 +1,6 @@
 use std::env;
 use std::fs;
-use std::io;
-use std::io::Write;
+use std::io::{BufWriter, Write};
 use std::path::Path;
 
 use chrono::{DateTime, Duration, Utc};
@@ -15,7 +14,7 @@ use serde::{Deserialize, Serialize};
 use crate::api::{Api, SentryCliRelease};
 use crate::config::Config;
 use crate::constants::{APP_INFO, VERSION};
-use crate::utils::fs::{is_writable, set_executable_mode};
+use crate::utils::fs::{is_writable, move_file, set_executable_mode};
 use crate::utils::system::{is_homebrew_install, is_npm_install, QuietExit};
 
 #[cfg(windows)]
@@ -28,6 +27,9 @@ fn rename_exe(exe: &Path, downloaded_path: &Path, elevate: bool) -> Result<(), E
     let tmp = env::temp_dir().join(".sentry-cli.tmp");
 
     if elevate {
+        // the three moves are deliberately batched through a single cmd
+        // invocation: spawning them separately would pop one UAC prompt
+        // per command.
         runas::Command::new("cmd")
             .arg("/c")
             .arg("move")
@@ -42,8 +44,10 @@ fn rename_exe(exe: &Path, downloaded_path: &Path, elevate: bool) -> Result<(), E
             .arg(&tmp)
             .status()?;
     } else {
-        fs::rename(&exe, &tmp)?;
-        fs::rename(&downloaded_path, &exe)?;
+        // the temp dir may live on another volume than the executable,
+        // in which case a plain rename would fail with EXDEV.
+        move_file(&exe, &tmp)?;
+        move_file(&downloaded_path, &exe)?;
         fs::remove_file(&tmp).ok();
     }
 
@@ -54,12 +58,13 @@ fn rename_exe(exe: &Path, downloaded_path: &Path, elevate: bool) -> Result<(), E
 fn rename_exe(exe: &Path, downloaded_path: &Path, elevate: bool) -> Result<(), Error> {
     if elevate {
         println!("Need to sudo to overwrite {}", exe.display());
+        // runas executes mv directly (via sudo); no shell is forked here.
         runas::Command::new("mv")
             .arg(&downloaded_path)
             .arg(&exe)
             .status()?;
     } else {
-        fs::rename(&downloaded_path, &exe)?;
+        move_file(&downloaded_path, &exe)?;
     }
     Ok(())
 }
@@ -150,15 +155,20 @@ impl SentryCliUpdateInfo {
         } else {
             exe.parent().unwrap().join(".sentry-cli.part")
         };
-        let mut f = fs::File::create(&tmp_path)?;
+        // buffer writes so the small chunks handed over by curl do not
+        // each turn into their own write syscall.
+        let mut f = BufWriter::new(fs::File::create(&tmp_path)?);
         let api = Api::current();
         match api.download_with_progress(self.download_url()?, &mut f) {
             Ok(_) => {}
             Err(err) => {
+                drop(f);
                 fs::remove_file(tmp_path).ok();
                 bail!(err);
             }
         };
+        f.flush()?;
+        drop(f);
 
         set_executable_mode(&tmp_path)?;
         rename_exe(&exe, &tmp_path, elevate)?;
@@ -202,8 +212,8 @@ fn update_nagger_impl() -> Result<(), Error> {
     path.push("updatecheck");
 
     let mut check: LastUpdateCheck;
-    if let Ok(f) = fs::File::open(&path) {
-        check = serde_json::from_reader(io::BufReader::new(f))?;
+    if let Ok(contents) = fs::read_to_string(&path) {
+        check = serde_json::from_str(&contents)?;
     } else {
         check = Default::default();
     }